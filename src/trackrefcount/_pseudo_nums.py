@@ -1,117 +1,102 @@
-class _singleton(type):
-    __inst = {}
-    def __call__(cls, *args, **kwargs):
-        if cls in cls.__inst:
-            return cls.__inst[cls]
-        i = super(_singleton, cls).__call__(*args, **kwargs)
-        cls.__inst[cls] = i
-        return i
+from operator import gt, ge, lt, le
+from typing import Any, Callable
+
+
+class _Singleton:
+    """Base class whose subclasses are instantiated at most once each.
+
+    Each class keeps its own instance in its own __dict__, so subclassing a
+    singleton type yields a distinct singleton. Any arguments to the call are
+    ignored.
+    """
+    def __new__(cls, *args, **kwargs):
+        inst = cls.__dict__.get("_instance")
+        if inst is None:
+            inst = super().__new__(cls)
+            cls._instance = inst
+        return inst
 
 
 class __FakeNumMixin:
     """Fake number base class with common traits."""
+    # Assigned at the end of the module, once all the instances exist.
+    _neg: "__FakeNumMixin"
+    _inv: "__FakeNumMixin"
+    # Comparison from the operator module, applied against zero.
+    _matches: Callable[[Any, int], Any]
+
     def __pos__(self):
         return self
 
+    def __neg__(self):
+        return self._neg
+
+    def __invert__(self):
+        return self._inv
+
     def __eq__(self, other):
+        if type(other) is int:  # The common case: a refcount delta.
+            return self._matches(other, 0)
         if self is other:
             return True
-        if self is -other or self is ~other or self is -~other:
+        # The other three pseudo-numbers: -self, ~self, and ~(-self).
+        neg = self._neg
+        if other is neg or other is self._inv or other is neg._inv:
             return False
+        if self._matches(other, 0):
+            return True
         return NotImplemented
 
+    def __ne__(self, other):
+        # Spelt out, so that "delta != assumption" in TrackRCFor.assertDelta
+        # need not go through object.__ne__ to reach __eq__.
+        if type(other) is int:
+            return not self._matches(other, 0)
+        p = self.__eq__(other)
+        if p is NotImplemented:
+            return p
+        return not p
 
-class NonNegType(__FakeNumMixin, metaclass=_singleton):
-    """A non-specific non-negative number."""
-    def __invert__(self):
-        return NegType()
-
-    def __neg__(self):
-        return NonPosType()
 
-    def __eq__(self, other):
-        p = super().__eq__(other)
-        if p is not NotImplemented:
-            return p
-        elif other >= 0:
-            return True
-        else:
-            return p
+class NonNegType(__FakeNumMixin, _Singleton):
+    """A non-specific non-negative number."""
+    _matches = staticmethod(ge)
 
     def __repr__(self):
         return "NonNeg"
 
 
-class NonPosType(__FakeNumMixin, metaclass=_singleton):
+class NonPosType(__FakeNumMixin, _Singleton):
     """The tilde-inversion of Pos. Unlike Neg, it compares equal to zero."""
-    def __invert__(self):
-        return PosType()
-
-    def __neg__(self):
-        return NonNegType()
-
-    def __eq__(self, other):
-        p = super().__eq__(other)
-        if p is not NotImplemented:
-            return p
-        elif other <= 0:
-            return True
-        else:
-            return p
+    _matches = staticmethod(le)
 
     def __repr__(self):
         return "NonPos"
 
 
-class PosType(__FakeNumMixin, metaclass=_singleton):
+class PosType(__FakeNumMixin, _Singleton):
     """Stand-in pseudo-number for unspecified positive value.
     An instance of this class compares equal to any (strictly) positive (that
     is, greater than zero) value.
     """
-    def __neg__(self):
-        return NegType()
-
-    def __invert__(self):
-        return NonPosType()
-
-    def __eq__(self, other):
-        p = super().__eq__(other)
-        if p is not NotImplemented:
-            return p
-        elif other > 0:
-            return True
-        else:
-            return p
+    _matches = staticmethod(gt)
 
     def __repr__(self):
         return "Pos"
 
 
-class NegType(__FakeNumMixin, metaclass=_singleton):
+class NegType(__FakeNumMixin, _Singleton):
     """Stand-in pseudo-number for unspecified negative value.
     An instance of this class compares equal to any (strictly) negative (that
     is, less than zero) value.
     """
-    def __neg__(self):
-        return PosType()
-
-    def __invert__(self):
-        return NonNegType()
-
-    def __eq__(self, other):
-        p = super().__eq__(other)
-        if p is not NotImplemented:
-            return p
-        elif other < 0:
-            return True
-        else:
-            return p
+    _matches = staticmethod(lt)
 
     def __repr__(self):
         return "Neg"
 
 
-class AnyType(metaclass=_singleton):
+class AnyType(_Singleton):
     """Stand-in pseudo-number for any unspecified value."""
     def __eq__(self, other):
         return True
@@ -125,3 +110,8 @@ Neg = NegType()
 NonNeg = NonNegType()
 NonPos = NonPosType()
 Anything = AnyType()
+
+PosType._neg, PosType._inv = Neg, NonPos
+NegType._neg, NegType._inv = Pos, NonNeg
+NonNegType._neg, NonNegType._inv = NonPos, Neg
+NonPosType._neg, NonPosType._inv = NonNeg, Pos
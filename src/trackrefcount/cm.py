@@ -1,19 +1,47 @@
 from sys import getrefcount
 from operator import sub
-from typing import Sequence, Tuple, ContextManager
-from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Sequence, Tuple
+from ._pseudo_nums import Anything
 
 
-def rc(args: Sequence) -> Tuple[int]:
-    """Return a list of reference counts reported by sys.getrefcount for each
+def rc(args: Sequence, _grc: Callable = getrefcount) -> Tuple[int, ...]:
+    """Return a tuple of reference counts reported by sys.getrefcount for each
     element in args.
     """
     # Using list comprehension will add the value by one due to loop variable
     # (unless explicitly suppressed). This doesn't matter -- just FYI.
-    return tuple(map(getrefcount, args))
+    return tuple(map(_grc, args))
 
 
-class TrackRCFor(AbstractContextManager):
+def _deltas(final: Sequence, initial: Sequence) -> Tuple[int, ...]:
+    """Return the tuple of element-wise differences final minus initial."""
+    return tuple(map(sub, final, initial))
+
+
+def _specialize(n: int) -> Tuple[Callable, Callable]:
+    """Generate straight-line equivalents of rc and _deltas for an n-element
+    args, free of any per-element iteration.
+    """
+    items = "".join("_grc(args[%d]), " % i for i in range(n))
+    diffs = "".join("final[%d] - initial[%d], " % (i, i) for i in range(n))
+    source = ("def rc_%d(args, _grc=getrefcount):\n"
+              '    """Same as rc, for exactly %d tracked objects."""\n'
+              "    return (%s)\n"
+              "def _deltas_%d(final, initial):\n"
+              '    """Same as _deltas, for exactly %d tracked objects."""\n'
+              "    return (%s)\n" % (n, n, items, n, n, diffs))
+    namespace: Dict[str, Any] = {"__name__": __name__,
+                                 "getrefcount": getrefcount}
+    exec(compile(source, "<%s._specialize(%d)>" % (__name__, n), "exec"),
+         namespace)
+    return namespace["rc_%d" % n], namespace["_deltas_%d" % n]
+
+
+# Specialized (rc, _deltas) pairs, indexed by the number of tracked objects.
+_SPECIALIZED = tuple(_specialize(n) for n in range(5))
+
+
+class TrackRCFor:
     """Track the reference count for a sequence of objects specified as
     arguments at init time.
 
@@ -39,19 +67,38 @@ class TrackRCFor(AbstractContextManager):
     extension code has much greater leeway and may introduce refcount-breaking
     bugs.
     """
-    __slots__ = ("args", "c_initial", "c_final")
-
-    def __init__(self, *args) -> None:
+    __slots__ = ("args", "c_initial", "c_final", "entered", "exited", "_rc",
+                 "_deltas")
+    args: Tuple
+    c_initial: Tuple[int, ...]  # Empty until marked.
+    c_final: Tuple[int, ...]
+    entered: bool
+    exited: bool
+    _rc: Callable[[Sequence], Tuple[int, ...]]
+    _deltas: Callable[[Sequence, Sequence], Tuple[int, ...]]
+
+    def __init__(self, *args: object) -> None:
         """Initialize a context manager that can be entered later by specifying
         which variables/names to track as arguments to the call. The arguments
         to the call are Python objects (loosely "variables") to be tracked by
         the context manager.
         """
+        self._setup(args)
+
+    def _setup(self, args: Tuple) -> None:
+        """Initialize the state for tracking the objects in the tuple args."""
         self.args = args
-        self.c_initial = None
-        self.c_final = None
+        self.c_initial = ()
+        self.c_final = ()
+        self.entered = False
+        self.exited = False
+        n = len(args)
+        if n < len(_SPECIALIZED):
+            self._rc, self._deltas = _SPECIALIZED[n]
+        else:
+            self._rc, self._deltas = rc, _deltas
 
-    def __call__(self) -> ContextManager:
+    def __call__(self) -> "TrackRCFor":
         """Called with no arguments: return a duplicate of self.
 
         The return value is an instance of the same type that keeps the same
@@ -66,6 +113,11 @@ class TrackRCFor(AbstractContextManager):
         It is kept as a short hand for creating a new context manager with the
         original tracked objects).
 
+        A duplicate of a subclass that overrides __init__ is created by
+        calling the subclass with the tracked objects, so that its own
+        initialization runs. Otherwise the duplicate shares the tuple of
+        tracked objects with self.
+
         Example:
 
         >>> a = object(); b = object()
@@ -76,30 +128,78 @@ class TrackRCFor(AbstractContextManager):
         ...     g.assertDelta(0, -1)
         >>> f.assertEqualRC()
         """
-        return self.__class__(*self.args)
-
-    def __enter__(self) -> ContextManager:
+        if self.exited:
+            raise TypeError("Context expired")
+        cls = type(self)
+        if cls.__init__ is not TrackRCFor.__init__:
+            # A subclass may set up state of its own in __init__.
+            return cls(*self.args)
+        # The duplicate shares the tuple of tracked objects rather than
+        # re-packing it, which saves an allocation and leaves the refcounts of
+        # the tracked objects themselves untouched.
+        dup = cls.__new__(cls)
+        dup._setup(self.args)
+        return dup
+
+    def __enter__(self) -> "TrackRCFor":
         """Enter the managed context by marking the initial refcounts.
 
         Exited ("expired") context manager cannot be entered again. Doing so
         will raise a TypeError.
         """
-        try:
-            args = self.args
-        except AttributeError:
-            raise TypeError("Context expired")
-        self.c_initial = rc(args)
+        self._start()
         return self
 
-    def __exit__(self, *exc_args) -> bool:
+    def __exit__(self, *exc_args: object) -> None:
         """Exit the managed context by marking the final refcounts. Exceptions
         raised in the suite (body of the "with"-block) will propagate.
+
+        Exiting a context manager that was never entered, or has already
+        exited, raises TypeError.
+        """
+        self._finish()
+
+    def _start(self) -> None:
+        """Mark the initial refcounts, refusing to do so if expired."""
+        if self.exited:
+            raise TypeError("Context expired")
+        self.c_initial = self._rc(self.args)
+        self.entered = True
+
+    def _finish(self) -> None:
+        """Mark the final refcounts and expire, refusing to do so unless
+        entered and not yet expired.
+        """
+        if self.exited:
+            raise TypeError("Context expired")
+        if not self.entered:
+            raise TypeError("Context has not been entered")
+        self.c_final = self._rc(self.args)
+        self.exited = True
+        self.args = ()  # Make it nicer to work with nested contexts.
+
+    def measure(self, func: Callable, *args, **kwargs) -> "TrackRCFor":
+        """Call func(*args, **kwargs) as if it were the body of the
+        "with"-block, and return self for making assertions.
+
+        Example:
+
+        >>> a = object()
+        >>> TrackRCFor(a).measure(dict, key=a).assertEqualRC()
+
+        The return value of the call is discarded before the final refcounts
+        are marked, just like the value of a bare expression statement in the
+        "with"-block. Exceptions raised in the call will propagate, but the
+        context manager is exited all the same.
         """
-        self.c_final = rc(self.args)
-        del self.args  # Make it nicer to work with nested contexts.
-        return False
+        self._start()
+        try:
+            func(*args, **kwargs)
+        finally:
+            self._finish()
+        return self
 
-    def assertDelta(self, *assumptions) -> None:
+    def assertDelta(self, *assumptions: object) -> None:
         """Assert the difference(s) in refcount ("after" minus "before") is the
         assumed amount.
 
@@ -111,25 +211,38 @@ class TrackRCFor(AbstractContextManager):
         The assertion method cannot be used while the context manager has not
         exited. Doing so will raise TypeError.
 
-        The assertion is made as a normal Python "assert" statement. Normally a
-        false assertion will raise AssertionError.
+        A false assertion raises AssertionError. Checking stops at the first
+        mismatching object.
         """
-        try:
-            self.args
-        except AttributeError:
-            pass
-        else:
+        if not self.exited:
             raise TypeError("Context has not finalized")
-        deltas = tuple(map(sub, self.c_final, self.c_initial))
-        n = len(deltas)
-        if len(assumptions) == 1:
-            assumed = (assumptions[0],) * n
+        c_initial, c_final = self.c_initial, self.c_final
+        n = len(c_initial)
+        la = len(assumptions)
+        if la == 1:
+            a = assumptions[0]
+            if a is Anything:  # Matches whatever the deltas are.
+                return
+            if n == 1:
+                if c_final[0] - c_initial[0] != a:
+                    self._mismatch(assumptions)
+                return
+            for d in map(sub, c_final, c_initial):
+                if d != a:
+                    self._mismatch(assumptions * n)
+        elif la == n:
+            # Tuple comparison runs element-wise in C, and still dispatches to
+            # the reflected __eq__ of any pseudo-numbers among assumptions.
+            if self._deltas(c_final, c_initial) != assumptions:
+                self._mismatch(assumptions)
         else:
-            assumed = assumptions
-        if len(assumed) != n:
             raise ValueError("Length of argument-list mismatch")
-        assert deltas == assumed, ("Measured: %r != Asserted: %r" %
-                                   (deltas, assumed))
+
+    def _mismatch(self, assumed: Tuple) -> None:
+        """Raise AssertionError reporting the measured and asserted deltas."""
+        deltas = self._deltas(self.c_final, self.c_initial)
+        raise AssertionError("Measured: %r != Asserted: %r" %
+                             (deltas, assumed))
 
     def assertEqualRC(self) -> None:
         """Shorthand for asserting no change in refcount."""
@@ -1,4 +1,5 @@
 from unittest import TestCase
+from contextlib import AbstractContextManager
 from trackrefcount import TrackRCFor, Pos, Neg, NonNeg, NonPos, Anything
 
 
@@ -36,6 +37,35 @@ class TestRefCountTracker(TestCase):
             del a
         t.assertDelta(-1, -1, -1)
 
+    def test_many_args(self):
+        objs = [object() for i in range(8)]
+        with TrackRCFor(*objs) as t:
+            kept = objs[::2]
+        t.assertDelta(*[1, 0] * 4)
+        with self.assertRaisesRegex(AssertionError, r"\(1, 0, 1, 0, 1, 0"):
+            t.assertEqualRC()
+
+    def test_each_arity(self):
+        # Covers both the specialized and the generic paths (n = 4 and 5).
+        for n in range(6):
+            with self.subTest(n=n):
+                objs = [object() for i in range(n)]
+                with TrackRCFor(*objs) as t:
+                    kept = objs[::2]
+                expected = [1 - i % 2 for i in range(n)]
+                t.assertDelta(*expected)
+                t.assertDelta(NonNeg)
+                t.assertDelta(*[NonNeg] * n)
+                if n == 0:
+                    continue
+                wrong = expected[:-1] + [expected[-1] + 1]
+                message = r"Measured: \(%s,?\) != Asserted: \(%s,?\)" % (
+                    ", ".join(map(str, expected)), ", ".join(map(str, wrong)))
+                with self.assertRaisesRegex(AssertionError, message):
+                    t.assertDelta(*wrong)
+                with self.assertRaises(AssertionError):
+                    t.assertDelta(Neg)
+
     def test_just_one_arg_in_delta_check(self):
         a, b, c = "spam", "spammer", "spamming"
         with TrackRCFor(a, b, c) as t:
@@ -137,6 +167,53 @@ class TestRefCountTracker(TestCase):
             del d
         f.assertEqualRC()
 
+    def test_nesting_single_by_self_duplication(self):
+        a = "turnip"
+        with TrackRCFor(a) as f:
+            b = a
+            with f() as g:
+                del b
+            g.assertDelta(-1)
+        f.assertEqualRC()
+
+    def test_duplication_keeps_refcount(self):
+        a = object()
+        f = TrackRCFor(a)
+        with TrackRCFor(a) as t:
+            g = f()
+        t.assertEqualRC()
+        self.assertIs(g.args, f.args)
+
+    def test_duplication_of_subclass(self):
+        class Strict(TrackRCFor):
+            def __init__(self, *args):
+                if not args:
+                    raise ValueError("Nothing to track")
+                super().__init__(*args)
+        a = object()
+        f = Strict(a, a)
+        g = f()
+        self.assertIs(type(g), Strict)
+        with g:
+            b = a
+        g.assertDelta(1, 1)
+
+    def test_duplication_of_subclass_with_state(self):
+        class Labelled(TrackRCFor):
+            __slots__ = ("label",)
+
+            def __init__(self, *args):
+                super().__init__(*args)
+                self.label = "tracker of %d" % len(args)
+        a = object()
+        f = Labelled(a)
+        g = f()
+        self.assertIs(type(g), Labelled)
+        self.assertEqual(g.label, "tracker of 1")
+        with g:
+            b = a
+        g.assertDelta(1)
+
     def test_nesting_by_using_pre_instantiated(self):
         a = "Another Python string, given to name \"a\""
         inner = TrackRCFor(a)
@@ -164,6 +241,36 @@ class TestRefCountTracker(TestCase):
             with t:
                 pass
 
+    def test_duplicate_expired_fail(self):
+        a = object()
+        with TrackRCFor(a) as t:
+            pass
+        self.assertTrue(t.exited)
+        self.assertEqual(t.args, ())
+        with self.assertRaisesRegex(TypeError, "Context expired"):
+            t()
+
+    def test_double_exit_fail(self):
+        for n in (1, 5):
+            objs = [object() for i in range(n)]
+            t = TrackRCFor(*objs)
+            with self.subTest(n=n):
+                with self.assertRaisesRegex(TypeError, "Context expired"):
+                    with t:
+                        with t:
+                            pass
+                t.assertEqualRC()
+                with self.assertRaises(AssertionError):
+                    t.assertDelta(5)
+
+    def test_exit_without_enter_fail(self):
+        a = object()
+        t = TrackRCFor(a)
+        with self.assertRaisesRegex(TypeError, "not been entered"):
+            t.__exit__(None, None, None)
+        with self.assertRaisesRegex(TypeError, "Context has not finalized"):
+            t.assertDelta(7)
+
     def test_wrong_arglist_length(self):
         a = object()
         b = object()
@@ -189,6 +296,31 @@ class TestRefCountTracker(TestCase):
                 del a
             t.assertEqualRC()
 
+    def test_no_instance_dict(self):
+        t = TrackRCFor(object())
+        self.assertFalse(hasattr(t, "__dict__"))
+        self.assertIsInstance(t, AbstractContextManager)
+
+    def test_measure(self):
+        a = object()
+        box = []
+        t = TrackRCFor(a).measure(box.append, a)
+        self.assertIsInstance(t, TrackRCFor)
+        t.assertDelta(1)
+
+    def test_measure_discards_result(self):
+        a = object()
+        TrackRCFor(a).measure(lambda x: [x], a).assertEqualRC()
+
+    def test_measure_raise_exception(self):
+        a = object()
+        t = TrackRCFor(a)
+        with self.assertRaises(ZeroDivisionError):
+            t.measure(divmod, 1, 0)
+        t.assertEqualRC()
+        with self.assertRaisesRegex(TypeError, "Context expired"):
+            t.measure(len, ())
+
 
 class TestUsingPseudoNums(TestCase):
     """Test the use of pseudo-numbers as substitute for exact delta values.
@@ -31,6 +31,20 @@ class TestIs:
     def test_instantiation(self, x):
         assert x is x.__class__()
 
+    @pytest.mark.parametrize("x", [Pos, Neg, Anything])
+    def test_instantiation_ignores_args(self, x):
+        assert x is x.__class__(3, key="value")
+
+    @pytest.mark.parametrize("x", [Pos, Neg, Anything])
+    def test_subclass_singleton(self, x):
+        class Sub(x.__class__):
+            pass
+        s = Sub()
+        assert type(s) is Sub
+        assert s is Sub()
+        assert s is not x
+        assert x is x.__class__()
+
 
 class TestStrictEquality:
     """Test the == and != operators"""